@@ -4,13 +4,21 @@ Main script to run the scientific paper scraper.
 
 import asyncio
 import argparse
-import json
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import List
+from pydantic import TypeAdapter
+from src.models.paper import Paper
 from src.scrapers.arxiv import ArxivScraper
+from src.scrapers.base import close_shared_session
 from src.scrapers.pubmed import PubMedScraper
 from src.config import DATA_DIR
 
+# Serializes a list of papers straight to JSON bytes via pydantic-core
+_PAPERS_ADAPTER = TypeAdapter(List[Paper])
+
 def save_results(papers, query):
     """Salva os resultados da pesquisa em um arquivo JSON."""
     # Cria o diretório se não existir
@@ -22,12 +30,18 @@ def save_results(papers, query):
     filename = f"search_{query.replace(' ', '_')}_{timestamp}.json"
     output_file = output_dir / filename
     
-    # Converte os papers para dicionário usando o método model_dump_json
-    papers_data = [paper.model_dump_json() for paper in papers]
-    
-    # Salva em JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(papers_data, f, ensure_ascii=False, indent=2)
+    # Serializa todos os papers numa única passada e grava num arquivo
+    # temporário, que substitui o destino de forma atômica
+    # (em caso de falha o temporário é removido)
+    tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(_PAPERS_ADAPTER.dump_json(papers, indent=2))
+            f.write(b'\n')
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
     
     print(f"\nResultados salvos em: {output_file}")
 
@@ -43,17 +57,26 @@ async def main():
     print(f"Searching for articles about: {args.search}")
     print("-" * 50)
     
-    # Initialize scrapers
+    # Initialize scrapers (both share the process-wide HTTP session)
     arxiv_scraper = ArxivScraper()
     pubmed_scraper = PubMedScraper()
     
     try:
-        # Search papers
-        print("Searching on arXiv...")
-        arxiv_papers = await arxiv_scraper.search(args.search, args.max)
+        # Search papers on both sources concurrently
+        print("Searching on arXiv and PubMed...")
+        arxiv_papers, pubmed_papers = await asyncio.gather(
+            arxiv_scraper.search(args.search, args.max),
+            pubmed_scraper.search(args.search, args.max),
+            return_exceptions=True
+        )
         
-        print("Searching on PubMed...")
-        pubmed_papers = await pubmed_scraper.search(args.search, args.max)
+        # A failing source should not discard the results of the other one
+        if isinstance(arxiv_papers, Exception):
+            print(f"Error searching on arXiv: {arxiv_papers}")
+            arxiv_papers = []
+        if isinstance(pubmed_papers, Exception):
+            print(f"Error searching on PubMed: {pubmed_papers}")
+            pubmed_papers = []
         
         # Combine results
         all_papers = arxiv_papers + pubmed_papers
@@ -61,17 +84,20 @@ async def main():
         print(f"\nFound {len(all_papers)} articles:")
         print("-" * 50)
         
-        # Display results
+        # Display results in a single buffered write
+        lines = []
         for i, paper in enumerate(all_papers, 1):
-            print(f"\nArticle {i}:")
-            print(f"Title: {paper.title}")
-            print(f"Authors: {', '.join(paper.authors)}")
-            print(f"Source: {paper.source}")
-            print(f"URL: {paper.url}")
+            lines.append(f"\nArticle {i}:")
+            lines.append(f"Title: {paper.title}")
+            lines.append(f"Authors: {', '.join(paper.authors)}")
+            lines.append(f"Source: {paper.source}")
+            lines.append(f"URL: {paper.url}")
             if paper.summary:
-                print("\nSummary:")
-                print(paper.summary)
-            print("-" * 50)
+                lines.append("\nSummary:")
+                lines.append(paper.summary)
+            lines.append("-" * 50)
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         # Save results
         save_results(all_papers, args.search)
@@ -80,6 +106,7 @@ async def main():
         # Ensure scrapers are properly closed
         await arxiv_scraper.close()
         await pubmed_scraper.close()
+        await close_shared_session()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -10,40 +10,43 @@ async def main(query: str = "artificial intelligence", max_results: int = 5):
     # Initialize the scraper
     scraper = PaperScraper()
     
-    print(f"\nSearching for articles about: {query}")
-    print("-" * 50)
-    
-    # Search arXiv papers
-    print("\nSearching on arXiv...")
-    arxiv_papers = await scraper.search_arxiv(query, max_results=max_results)
-    
-    # Search PubMed papers
-    print("\nSearching on PubMed...")
-    pubmed_papers = await scraper.search_pubmed(query, max_results=max_results)
-    
-    # Combine results
-    all_papers = arxiv_papers + pubmed_papers
-    
-    # Display results
-    print(f"\nFound {len(all_papers)} articles:")
-    print("-" * 50)
-    
-    for i, paper in enumerate(all_papers, 1):
-        print(f"\nArticle {i}:")
-        print(f"Title: {paper.title}")
-        print(f"Authors: {', '.join(paper.authors)}")
-        print(f"Source: {paper.source}")
-        print(f"URL: {paper.url}")
+    try:
+        print(f"\nSearching for articles about: {query}")
+        print("-" * 50)
+        
+        # Search arXiv papers
+        print("\nSearching on arXiv...")
+        arxiv_papers = await scraper.search_arxiv(query, max_results=max_results)
         
-        # Generate abstract summary
-        if paper.abstract:
-            summary = scraper.generate_summary(paper.abstract)
-            print(f"\nSummary:")
-            print(summary)
-        else:
-            print("\nSummary not available")
+        # Search PubMed papers
+        print("\nSearching on PubMed...")
+        pubmed_papers = await scraper.search_pubmed(query, max_results=max_results)
         
+        # Combine results
+        all_papers = arxiv_papers + pubmed_papers
+        
+        # Display results
+        print(f"\nFound {len(all_papers)} articles:")
         print("-" * 50)
+        
+        for i, paper in enumerate(all_papers, 1):
+            print(f"\nArticle {i}:")
+            print(f"Title: {paper.title}")
+            print(f"Authors: {', '.join(paper.authors)}")
+            print(f"Source: {paper.source}")
+            print(f"URL: {paper.url}")
+            
+            # Generate abstract summary
+            if paper.abstract:
+                summary = scraper.generate_summary(paper.abstract)
+                print(f"\nSummary:")
+                print(summary)
+            else:
+                print("\nSummary not available")
+            
+            print("-" * 50)
+    finally:
+        await scraper.close()
 
 if __name__ == "__main__":
     # Set up argument parser
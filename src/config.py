@@ -6,8 +6,10 @@ including API endpoints, timeouts, and other parameters.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,27 +19,52 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'data'
 LOG_DIR = BASE_DIR / 'logs'
+CACHE_DIR = BASE_DIR / 'cache'
 
 # Create directories if they don't exist
 DATA_DIR.mkdir(exist_ok=True)
 LOG_DIR.mkdir(exist_ok=True)
+CACHE_DIR.mkdir(exist_ok=True)
 
 # API Configuration
-API_CONFIG: Dict[str, Any] = {
-    'arxiv': {
-        'base_url': 'http://export.arxiv.org/api/query',
-        'max_results': 100,
-        'timeout': 30,
-        'retry_attempts': 3,
-        'retry_delay': 5
-    },
-    'pubmed': {
-        'base_url': 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils',
-        'max_results': 100,
-        'timeout': 30,
-        'retry_attempts': 3,
-        'retry_delay': 5
-    }
+@dataclass(frozen=True, slots=True)
+class SourceConfig:
+    """Immutable connection settings for a paper source."""
+    base_url: str
+    max_results: int
+    timeout: int
+    retry_attempts: int
+    retry_delay: int
+
+ARXIV_CONFIG = SourceConfig(
+    base_url='http://export.arxiv.org/api/query',
+    max_results=100,
+    timeout=30,
+    retry_attempts=3,
+    retry_delay=5
+)
+
+PUBMED_CONFIG = SourceConfig(
+    base_url='https://eutils.ncbi.nlm.nih.gov/entrez/eutils',
+    max_results=100,
+    timeout=30,
+    retry_attempts=3,
+    retry_delay=5
+)
+
+# Optional NCBI E-utilities API key (raises PubMed's rate limit from 3 to 10 req/s)
+NCBI_API_KEY = os.getenv('NCBI_API_KEY')
+
+API_CONFIG: Mapping[str, SourceConfig] = MappingProxyType({
+    'arxiv': ARXIV_CONFIG,
+    'pubmed': PUBMED_CONFIG
+})
+
+# Response Cache Configuration
+CACHE_CONFIG: Dict[str, Any] = {
+    'path': CACHE_DIR / 'responses.sqlite3',
+    'ttl': 3600,  # seconds
+    'size_limit': 512 * 1024 * 1024  # bytes
 }
 
 # Text Processing Configuration
@@ -54,7 +81,7 @@ TEXT_PROCESSING_CONFIG: Dict[str, Any] = {
 }
 
 # Logging Configuration
-LOGGING_CONFIG: Dict[str, Any] = {
+LOGGING_CONFIG: Mapping[str, Any] = MappingProxyType({
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
@@ -83,4 +110,4 @@ LOGGING_CONFIG: Dict[str, Any] = {
             'propagate': True
         }
     }
-} 
\ No newline at end of file
+})
@@ -36,27 +36,3 @@ class Paper(BaseModel):
     keywords: Optional[List[str]] = None
     summary: Optional[str] = None
 
-    class Config:
-        """Pydantic model configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        
-    def model_dump_json(self) -> dict:
-        """
-        Convert the paper object to a JSON-serializable dictionary.
-        
-        Returns:
-            dict: JSON-serializable dictionary representation of the paper
-        """
-        return {
-            'title': self.title,
-            'authors': self.authors,
-            'abstract': self.abstract,
-            'url': self.url,
-            'published': self.published.isoformat(),
-            'source': self.source,
-            'doi': self.doi,
-            'keywords': self.keywords,
-            'summary': self.summary
-        } 
\ No newline at end of file
@@ -1,30 +1,44 @@
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from nltk.probability import FreqDist
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 import arxiv
-from bs4 import BeautifulSoup
-import json
 from concurrent.futures import ThreadPoolExecutor
-import lxml
+from lxml import etree
 import re
 import string
+import heapq
+import hashlib
+from operator import attrgetter
+from functools import lru_cache
 
 # Configuração do logger
 logger.add("paper_scraper.log", rotation="500 MB")
 
+# Tokenizadores pré-compilados usados na geração de resumos
+_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Normalização de títulos para deduplicação
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+def _title_key(title: str) -> bytes:
+    """Gera uma chave compacta de 16 bytes a partir do título normalizado"""
+    normalized = _WS_RE.sub(' ', _PUNCT_RE.sub('', title.lower())).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
 class Paper(BaseModel):
     """Modelo para representar um paper científico"""
     title: str
@@ -38,47 +52,118 @@ class Paper(BaseModel):
     citations: Optional[int] = None
     summary: Optional[str] = None
 
+    # (título, chave) do último cálculo de title_key
+    _title_key_cache: Optional[Tuple[str, bytes]] = PrivateAttr(default=None)
+
+    @property
+    def title_key(self) -> bytes:
+        """
+        Chave de deduplicação do título normalizado, calculada uma vez por instância.
+        O cache guarda o título de origem e é refeito se o título mudar
+        (atribuição ou model_copy(update=...)).
+        """
+        cached = self._title_key_cache
+        if cached is None or cached[0] != self.title:
+            cached = (self.title, _title_key(self.title))
+            self._title_key_cache = cached
+        return cached[1]
+
+# Serializa listas de papers direto para bytes JSON via pydantic-core
+_PAPERS_ADAPTER = TypeAdapter(List[Paper])
+
 class PaperScraper:
     def __init__(self):
         """
         Inicializa o scraper com configurações necessárias
         """
-        # Configuração do NLTK
-        self._setup_nltk()
-        
         # Configuração do cache
-        self.cache_dir = Path("cache")
+        self.cache_dir = Path(__file__).resolve().parent.parent / "cache"
         self.cache_dir.mkdir(exist_ok=True)
         
-        # Configuração do executor para operações paralelas
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Configuração do NLTK
+        self._setup_nltk()
+        
+        # Executor para operações bloqueantes (criado sob demanda)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
-    def _setup_nltk(self):
-        """Configura recursos necessários do NLTK"""
+        # Recursos reutilizados em todas as chamadas
         try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
+            self._stopwords = frozenset(stopwords.words('english'))
         except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
+            logger.warning("Stopwords do NLTK indisponíveis; palavras-chave incluirão stopwords")
+            self._stopwords = frozenset()
+        self._vectorizer = TfidfVectorizer()
 
-    def _clean_text(self, text: str) -> str:
-        """Limpa o texto removendo caracteres especiais e normalizando espaços"""
-        # Remove caracteres especiais e números
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\d+', '', text)
-        # Remove espaços extras
-        text = ' '.join(text.split())
-        return text.lower()
+        # Cache LRU de resumos por instância (textos idênticos não são reprocessados)
+        self._cached_summary = lru_cache(maxsize=512)(self._generate_summary_impl)
+
+        # Sessão HTTP compartilhada (criada sob demanda) e limite de requisições
+        # simultâneas ao PubMed, conforme a taxa permitida pelo NCBI sem API key
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pubmed_sem = asyncio.Semaphore(3)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Retorna a sessão HTTP compartilhada, criando-a na primeira chamada"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Retorna o executor de threads, criando-o na primeira chamada"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        return self._executor
+
+    async def close(self):
+        """Fecha a sessão HTTP e o executor, se existirem"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _setup_nltk(self):
+        """
+        Configura recursos necessários do NLTK, baixando-os no diretório de cache
+        apenas se ainda não estiverem instalados.
+        Um arquivo sentinela guarda onde o corpus foi encontrado, evitando
+        novas buscas no caminho do NLTK enquanto esse local existir.
+        """
+        nltk_dir = str(self.cache_dir / 'nltk_data')
+        if nltk_dir not in nltk.data.path:
+            nltk.data.path.insert(0, nltk_dir)
+        
+        ready = self.cache_dir / '.nltk_ok'
+        try:
+            location = ready.read_text().strip()
+            if location and Path(location).exists():
+                return
+        except OSError:
+            pass
+        
+        try:
+            found = nltk.data.find('corpora/stopwords')
+        except LookupError:
+            try:
+                nltk.download('stopwords', download_dir=nltk_dir, quiet=True, raise_on_error=True)
+                found = nltk.data.find('corpora/stopwords')
+            except Exception as e:
+                logger.error(f"Erro ao baixar stopwords do NLTK: {str(e)}")
+                return
+        
+        # FileSystemPathPointer expõe .path; ZipFilePathPointer, o arquivo zip
+        location = getattr(found, 'path', None) or found.zipfile.filename
+        ready.write_text(location)
 
     def _extract_keywords(self, text: str, num_keywords: int = 10) -> List[str]:
         """Extrai as palavras-chave mais relevantes do texto"""
-        # Tokeniza e limpa o texto
-        words = word_tokenize(self._clean_text(text))
-        stop_words = set(stopwords.words('english'))
+        # Tokeniza o texto (apenas palavras com 3 ou mais letras)
+        words = _WORD_RE.findall(text.lower())
         
-        # Remove stopwords e palavras muito curtas
-        words = [word for word in words if word not in stop_words and len(word) > 2]
+        # Remove stopwords
+        words = [word for word in words if word not in self._stopwords]
         
         # Calcula frequência das palavras
         fdist = FreqDist(words)
@@ -89,10 +174,11 @@ class PaperScraper:
     def _calculate_sentence_scores(self, sentences: List[str], keywords: List[str]) -> Dict[str, float]:
         """Calcula a pontuação de cada sentença baseada em palavras-chave e posição"""
         sentence_scores = {}
+        keyword_set = frozenset(keywords)
         
         for i, sentence in enumerate(sentences):
             # Pontuação baseada em palavras-chave
-            keyword_score = sum(1 for word in word_tokenize(sentence.lower()) if word in keywords)
+            keyword_score = sum(1 for word in _WORD_RE.findall(sentence.lower()) if word in keyword_set)
             
             # Pontuação baseada na posição (primeiras sentenças são mais importantes)
             position_score = 1.0 / (i + 1)
@@ -107,11 +193,16 @@ class PaperScraper:
 
     def generate_summary(self, text: str, num_sentences: int = 3) -> str:
         """
-        Gera um resumo do texto usando técnicas de NLP
+        Gera um resumo do texto usando técnicas de NLP.
+        Resumos de textos repetidos são reaproveitados do cache.
         """
+        return self._cached_summary(text, num_sentences)
+
+    def _generate_summary_impl(self, text: str, num_sentences: int) -> str:
+        """Implementação da geração de resumo, sem cache"""
         try:
             # Divide o texto em sentenças
-            sentences = sent_tokenize(text)
+            sentences = _SENT_RE.split(text.strip())
             
             if len(sentences) <= num_sentences:
                 return text
@@ -123,20 +214,23 @@ class PaperScraper:
             sentence_scores = self._calculate_sentence_scores(sentences, keywords)
             
             # Seleciona as sentenças com maior pontuação
-            top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
+            top_sentences = heapq.nlargest(num_sentences, sentence_scores.items(), key=lambda x: x[1])
             
             # Ordena as sentenças na ordem original
-            summary_sentences = [sentence for sentence, _ in sorted(top_sentences, key=lambda x: sentences.index(x[0]))]
+            order = {}
+            for i, sentence in enumerate(sentences):
+                order.setdefault(sentence, i)
+            top_sentences.sort(key=lambda x: order[x[0]])
             
-            return ' '.join(summary_sentences)
+            return ' '.join(sentence for sentence, _ in top_sentences)
         except Exception as e:
             logger.error(f"Erro ao gerar resumo NLP: {str(e)}")
             return text[:500] + "..."  # Retorna os primeiros 500 caracteres em caso de erro
 
     def _safe_get_text(self, element, default=""):
-        """Extrai texto de um elemento BeautifulSoup de forma segura"""
-        if element and hasattr(element, 'text'):
-            return element.text.strip()
+        """Extrai o texto (incluindo marcações internas) de um elemento lxml de forma segura"""
+        if element is not None:
+            return ''.join(element.itertext()).strip()
         return default
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
@@ -151,8 +245,13 @@ class PaperScraper:
                 sort_by=arxiv.SortCriterion.SubmittedDate
             )
 
+            # search.results() faz requisições HTTP bloqueantes; roda no executor
+            # para não travar o event loop enquanto o PubMed é consultado
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self._get_executor(), lambda: list(search.results()))
+
             papers = []
-            for result in search.results():
+            for result in results:
                 try:
                     paper = Paper(
                         title=result.title,
@@ -182,61 +281,69 @@ class PaperScraper:
             base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
             search_url = f"{base_url}esearch.fcgi"
             
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    'db': 'pubmed',
-                    'term': query,
-                    'retmax': max_results,
-                    'retmode': 'json',
-                    'sort': 'date'
-                }
-                
+            session = self._get_session()
+            params = {
+                'db': 'pubmed',
+                'term': query,
+                'retmax': max_results,
+                'retmode': 'json',
+                'sort': 'date'
+            }
+            
+            async with self._pubmed_sem:
                 async with session.get(search_url, params=params) as response:
                     data = await response.json()
-                
-                papers = []
-                for pmid in data['esearchresult']['idlist']:
-                    try:
-                        fetch_url = f"{base_url}efetch.fcgi"
-                        fetch_params = {
-                            'db': 'pubmed',
-                            'id': pmid,
-                            'retmode': 'xml'
-                        }
-                        
-                        async with session.get(fetch_url, params=fetch_params) as paper_response:
-                            text = await paper_response.text()
-                            soup = BeautifulSoup(text, 'lxml-xml')
-                            
-                            # Extrai informações de forma segura
-                            title = self._safe_get_text(soup.find('ArticleTitle'))
-                            if not title:  # Pula se não encontrar título
-                                continue
-                                
-                            authors = []
-                            for author in soup.find_all('Author'):
-                                last_name = self._safe_get_text(author.find('LastName'))
-                                fore_name = self._safe_get_text(author.find('ForeName'))
-                                if last_name or fore_name:
-                                    authors.append(f"{last_name} {fore_name}".strip())
-                            
-                            abstract = self._safe_get_text(soup.find('AbstractText'))
-                            published = self._safe_get_text(soup.find('PubDate'))
-                            
-                            paper = Paper(
-                                title=title,
-                                authors=authors if authors else ["Autor Desconhecido"],
-                                abstract=abstract if abstract else "Resumo não disponível",
-                                url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                                published=published if published else "Data não disponível",
-                                source='pubmed'
-                            )
-                            papers.append(paper)
-                    except Exception as e:
-                        logger.error(f"Erro ao processar artigo do PubMed {pmid}: {str(e)}")
+            
+            pmids = data['esearchresult']['idlist']
+            if not pmids:
+                return []
+            
+            # Busca todos os artigos numa única requisição efetch
+            fetch_url = f"{base_url}efetch.fcgi"
+            fetch_params = {
+                'db': 'pubmed',
+                'id': ','.join(pmids),
+                'retmode': 'xml'
+            }
+            
+            async with self._pubmed_sem:
+                async with session.get(fetch_url, params=fetch_params) as fetch_response:
+                    body = await fetch_response.read()
+            root = etree.fromstring(body)
+            
+            papers = []
+            for article in root.iterfind('.//PubmedArticle'):
+                pmid = self._safe_get_text(article.find('.//PMID'))
+                try:
+                    # Extrai informações de forma segura
+                    title = self._safe_get_text(article.find('.//ArticleTitle'))
+                    if not title:  # Pula se não encontrar título
                         continue
-                
-                return papers
+                        
+                    authors = []
+                    for author in article.iterfind('.//Author'):
+                        last_name = self._safe_get_text(author.find('LastName'))
+                        fore_name = self._safe_get_text(author.find('ForeName'))
+                        if last_name or fore_name:
+                            authors.append(f"{last_name} {fore_name}".strip())
+                    
+                    abstract = self._safe_get_text(article.find('.//AbstractText'))
+                    published = self._safe_get_text(article.find('.//PubDate'))
+                    
+                    paper = Paper(
+                        title=title,
+                        authors=authors if authors else ["Autor Desconhecido"],
+                        abstract=abstract if abstract else "Resumo não disponível",
+                        url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                        published=published if published else "Data não disponível",
+                        source='pubmed'
+                    )
+                    papers.append(paper)
+                except Exception as e:
+                    logger.error(f"Erro ao processar artigo do PubMed {pmid}: {str(e)}")
+                    continue
+            
+            return papers
         except Exception as e:
             logger.error(f"Erro ao buscar no PubMed: {str(e)}")
             return []
@@ -247,18 +354,21 @@ class PaperScraper:
         """
         if not papers:
             return papers
+        
+        # Garante um score numérico mesmo se o cálculo falhar
+        for paper in papers:
+            paper.relevance_score = 0.0
             
         try:
-            vectorizer = TfidfVectorizer()
             texts = [paper.abstract for paper in papers]
-            tfidf_matrix = vectorizer.fit_transform([query] + texts)
+            tfidf_matrix = self._vectorizer.fit_transform([query] + texts)
             
             similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])
             
             for i, paper in enumerate(papers):
                 paper.relevance_score = float(similarities[0][i])
             
-            return sorted(papers, key=lambda x: x.relevance_score, reverse=True)
+            return sorted(papers, key=attrgetter('relevance_score'), reverse=True)
         except Exception as e:
             logger.error(f"Erro ao calcular relevância: {str(e)}")
             return papers
@@ -268,8 +378,8 @@ class PaperScraper:
         Salva os papers em um arquivo JSON
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump([paper.model_dump() for paper in papers], f, ensure_ascii=False, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(_PAPERS_ADAPTER.dump_json(papers, indent=2))
             logger.info(f"Papers saved in {filename}")
         except Exception as e:
             logger.error(f"Error saving papers: {str(e)}")
@@ -294,25 +404,28 @@ async def main():
     
     all_papers = []
     
-    # Busca assíncrona em múltiplas fontes para cada query
-    for query in queries:
-        logger.info(f"\nBuscando artigos sobre: {query}")
-        
-        arxiv_papers, pubmed_papers = await asyncio.gather(
-            scraper.search_arxiv(query),
-            scraper.search_pubmed(query)
-        )
-        
-        logger.info(f"Encontrados {len(arxiv_papers)} artigos no arXiv")
-        logger.info(f"Encontrados {len(pubmed_papers)} artigos no PubMed")
-        
-        # Combina resultados
-        query_papers = arxiv_papers + pubmed_papers
-        
-        if query_papers:
-            # Calcula relevância
-            relevant_papers = scraper.calculate_relevance(query_papers, query)
-            all_papers.extend(relevant_papers)
+    try:
+        # Busca assíncrona em múltiplas fontes para cada query
+        for query in queries:
+            logger.info(f"\nBuscando artigos sobre: {query}")
+            
+            arxiv_papers, pubmed_papers = await asyncio.gather(
+                scraper.search_arxiv(query),
+                scraper.search_pubmed(query)
+            )
+            
+            logger.info(f"Encontrados {len(arxiv_papers)} artigos no arXiv")
+            logger.info(f"Encontrados {len(pubmed_papers)} artigos no PubMed")
+            
+            # Combina resultados
+            query_papers = arxiv_papers + pubmed_papers
+            
+            if query_papers:
+                # Calcula relevância
+                relevant_papers = scraper.calculate_relevance(query_papers, query)
+                all_papers.extend(relevant_papers)
+    finally:
+        await scraper.close()
     
     if not all_papers:
         logger.warning("Nenhum artigo encontrado")
@@ -322,12 +435,13 @@ async def main():
     seen_titles = set()
     unique_papers = []
     for paper in all_papers:
-        if paper.title.lower() not in seen_titles:
-            seen_titles.add(paper.title.lower())
+        title_key = paper.title_key
+        if title_key not in seen_titles:
+            seen_titles.add(title_key)
             unique_papers.append(paper)
     
     # Ordena todos os papers por relevância
-    unique_papers.sort(key=lambda x: x.relevance_score or 0, reverse=True)
+    unique_papers.sort(key=attrgetter('relevance_score'), reverse=True)
     
     # Gera resumos para os top 5 papers
     for i, paper in enumerate(unique_papers[:5]):
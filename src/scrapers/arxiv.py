@@ -5,15 +5,32 @@ This module implements the arXiv paper scraper, which searches and retrieves
 papers from the arXiv API.
 """
 
-from typing import List
-import xml.etree.ElementTree as ET
+from typing import List, Optional
+import logging
+import io
 from datetime import datetime
 import urllib.parse
 
+import aiohttp
+from lxml import etree
+
 from .base import BaseScraper
 from src.models.paper import Paper
 from src.config import API_CONFIG
 from src.utils.text_processing import generate_summary, setup_nltk
+from src.utils.logger import setup_logger
+
+log = setup_logger()
+
+# Fully-qualified (Clark notation) Atom tags, so lookups skip prefix resolution
+ATOM = '{http://www.w3.org/2005/Atom}'
+ENTRY_TAG = ATOM + 'entry'
+TITLE_TAG = ATOM + 'title'
+SUMMARY_TAG = ATOM + 'summary'
+AUTHOR_TAG = ATOM + 'author'
+NAME_TAG = ATOM + 'name'
+ID_TAG = ATOM + 'id'
+PUBLISHED_TAG = ATOM + 'published'
 
 class ArxivScraper(BaseScraper):
     """
@@ -23,19 +40,25 @@ class ArxivScraper(BaseScraper):
     including search and parsing of arXiv XML responses.
     """
     
-    def __init__(self):
-        """Initialize the arXiv scraper."""
-        super().__init__('arxiv')
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the arXiv scraper.
+        
+        Args:
+            session (Optional[aiohttp.ClientSession]): Shared HTTP session
+        """
+        super().__init__('arxiv', session)
         # Setup NLTK resources
         setup_nltk()
     
-    async def search(self, query: str, max_results: int = 10) -> List[Paper]:
+    async def search(self, query: str, max_results: int = 10, force_refresh: bool = False) -> List[Paper]:
         """
         Search for papers on arXiv.
         
         Args:
             query (str): Search query
             max_results (int): Maximum number of results to return
+            force_refresh (bool): Bypass the response cache and fetch from the network
             
         Returns:
             List[Paper]: List of matching papers
@@ -44,27 +67,24 @@ class ArxivScraper(BaseScraper):
         params = {
             'search_query': f'ti:{query} OR abs:{query}',  # Search in title and abstract
             'start': 0,
-            'max_results': min(max_results * 2, self.config['max_results']),  # Get more results for better filtering
+            'max_results': min(max_results * 2, self.config.max_results),  # Get more results for better filtering
             'sortBy': 'relevance',  # Sort by relevance instead of date
             'sortOrder': 'descending'
         }
         
         # Make request to arXiv API
-        response_text = await self._make_request(
-            self.config['base_url'],
-            params
+        response_body = await self._make_request(
+            self.config.base_url,
+            params,
+            force_refresh
         )
         
-        # Parse XML response
-        root = ET.fromstring(response_text)
-        namespace = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        # Extract papers
+        # Stream-parse the XML response, releasing each entry once processed
         papers = []
-        for entry in root.findall('.//atom:entry', namespace):
+        for _, entry in etree.iterparse(io.BytesIO(response_body), tag=ENTRY_TAG):
             try:
-                abstract = entry.find('atom:summary', namespace).text
-                title = entry.find('atom:title', namespace).text
+                abstract = entry.find(SUMMARY_TAG).text
+                title = entry.find(TITLE_TAG).text
                 
                 # Skip papers without abstract or with very short abstracts
                 if not abstract or len(abstract.split()) < 10:
@@ -73,13 +93,13 @@ class ArxivScraper(BaseScraper):
                 paper_data = {
                     'title': title,
                     'authors': [
-                        author.find('atom:name', namespace).text
-                        for author in entry.findall('atom:author', namespace)
+                        author.find(NAME_TAG).text
+                        for author in entry.findall(AUTHOR_TAG)
                     ],
                     'abstract': abstract,
-                    'url': entry.find('atom:id', namespace).text,
+                    'url': entry.find(ID_TAG).text,
                     'published': datetime.strptime(
-                        entry.find('atom:published', namespace).text,
+                        entry.find(PUBLISHED_TAG).text,
                         '%Y-%m-%dT%H:%M:%SZ'
                     ),
                     'source': 'arxiv',
@@ -87,13 +107,25 @@ class ArxivScraper(BaseScraper):
                 }
                 papers.append(self._parse_paper(paper_data))
             except (AttributeError, ValueError) as e:
-                print(f"Error parsing paper: {e}")
+                log.warning(
+                    "Failed to parse %s entry: %s", self.source_name, e,
+                    exc_info=log.isEnabledFor(logging.DEBUG)
+                )
                 continue
+            finally:
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+            
+            # Stop once the candidate pool used for re-ranking is full
+            if len(papers) >= params['max_results']:
+                break
             
         # Sort papers by relevance (title match first, then abstract match)
+        query_lower = query.lower()
         papers.sort(key=lambda p: (
-            query.lower() not in p.title.lower(),  # True comes after False
-            query.lower() not in p.abstract.lower()
+            query_lower not in p.title.lower(),  # True comes after False
+            query_lower not in p.abstract.lower()
         ))
         
         return papers[:max_results]
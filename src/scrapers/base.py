@@ -9,11 +9,64 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 import aiohttp
 import asyncio
+import random
 from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.models.paper import Paper
-from src.config import API_CONFIG
+from src.config import API_CONFIG, CACHE_CONFIG
+from src.utils.response_cache import ResponseCache
+
+# Failures worth retrying: connection problems/timeouts and these HTTP statuses
+# (plus any 5xx). Other 4xx responses are permanent and raised immediately.
+RETRYABLE_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+RETRYABLE_STATUS = {429}
+
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_RESPONSE_CACHE: Optional[ResponseCache] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+    
+    All scrapers share this session so its connection pool, keep-alive
+    connections and DNS cache survive across scrapers and requests.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return _SHARED_SESSION
+
+async def close_shared_session():
+    """
+    Close the process-wide HTTP session and response cache.
+    Call once at application exit.
+    """
+    global _SHARED_SESSION, _RESPONSE_CACHE
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+    if _RESPONSE_CACHE is not None:
+        _RESPONSE_CACHE.close()
+    _RESPONSE_CACHE = None
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, opening it on first use."""
+    global _RESPONSE_CACHE
+    if _RESPONSE_CACHE is None:
+        _RESPONSE_CACHE = ResponseCache(
+            CACHE_CONFIG['path'],
+            ttl=CACHE_CONFIG['ttl'],
+            size_limit=CACHE_CONFIG['size_limit']
+        )
+    return _RESPONSE_CACHE
 
 class BaseScraper(ABC):
     """
@@ -24,77 +77,115 @@ class BaseScraper(ABC):
     
     Attributes:
         source_name (str): Name of the source (e.g., 'arxiv', 'pubmed')
-        config (dict): Configuration for this scraper
+        config (SourceConfig): Configuration for this scraper
         session (Optional[aiohttp.ClientSession]): HTTP session for requests
     """
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the scraper.
         
         Args:
             source_name (str): Name of the source to scrape
+            session (Optional[aiohttp.ClientSession]): HTTP session owned by the
+                caller. If omitted, the process-wide session from get_session()
+                is used.
         """
         self.source_name = source_name
         self.config = API_CONFIG[source_name]
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
     
     async def __aenter__(self):
-        """Create HTTP session when entering async context."""
+        """Attach the HTTP session when entering async context."""
         await self.ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close HTTP session when exiting async context."""
-        await self.close()
+        """Leave the session open; it is shared and closed at application exit."""
     
     async def ensure_session(self):
         """Ensure a valid session exists."""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = await get_session()
     
     async def close(self):
-        """Close the HTTP session if it exists."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """
+        Release this scraper's reference to the HTTP session.
+        
+        The session itself is shared (or owned by the caller) and is not
+        closed here; use close_shared_session() at application exit.
+        """
+        self.session = None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    async def _make_request(self, url: str, params: dict) -> str:
+    async def _make_request(self, url: str, params: dict, force_refresh: bool = False) -> bytes:
         """
-        Make HTTP request with retry logic.
+        Make HTTP request with retry logic, serving repeated requests from
+        the on-disk response cache.
         
         Args:
             url (str): URL to request
             params (dict): Query parameters
+            force_refresh (bool): Skip the cache lookup and fetch from the network
             
         Returns:
-            str: Response text
+            bytes: Raw response body
             
         Raises:
-            aiohttp.ClientError: If request fails after retries
+            aiohttp.ClientError: If request fails after retries, or immediately
+                on a non-retryable HTTP error
         """
+        cache = get_response_cache()
+        key = cache.make_key(url, params)
+        if not force_refresh:
+            body = cache.get(key)
+            if body is not None:
+                return body
+        
         await self.ensure_session()
-            
-        try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.text()
-        except Exception as e:
-            await self.close()
-            raise e
+        
+        # Retry transient failures with exponential backoff (starting at
+        # retry_delay) and jitter. Errors must not tear down the pooled connections.
+        # At least one attempt is always made, so last_error is set on failure.
+        last_error: Optional[Exception] = None
+        for attempt in range(max(1, self.config.retry_attempts)):
+            if attempt:
+                delay = min(10, self.config.retry_delay * 2 ** (attempt - 1))
+                await asyncio.sleep(delay + random.random() * 0.2)
+            await self._throttle()
+            try:
+                async with self.session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                break
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUS and e.status < 500:
+                    raise
+                last_error = e
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+        else:
+            raise last_error
+        
+        cache.set(key, body)
+        return body
+    
+    async def _throttle(self):
+        """
+        Wait until the source's rate limit allows another network request.
+        
+        Called before every network attempt (cache hits skip it). The default
+        imposes no limit; subclasses for rate-limited APIs override it.
+        """
     
     @abstractmethod
-    async def search(self, query: str, max_results: int = 10) -> List[Paper]:
+    async def search(self, query: str, max_results: int = 10, force_refresh: bool = False) -> List[Paper]:
         """
         Search for papers matching the query.
         
         Args:
             query (str): Search query
             max_results (int): Maximum number of results to return
+            force_refresh (bool): Bypass the response cache and fetch from the network
             
         Returns:
             List[Paper]: List of matching papers
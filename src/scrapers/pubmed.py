@@ -5,16 +5,33 @@ This module implements the PubMed paper scraper, which searches and retrieves
 papers from the PubMed API using E-utilities.
 """
 
-from typing import List
-import xml.etree.ElementTree as ET
+from typing import List, Optional
+import logging
+import asyncio
+import io
 from datetime import datetime
 import urllib.parse
-import json
+
+import aiohttp
+import orjson
+from lxml import etree
 
 from .base import BaseScraper
 from src.models.paper import Paper
-from src.config import API_CONFIG
+from src.config import API_CONFIG, NCBI_API_KEY
 from src.utils.text_processing import generate_summary, setup_nltk
+from src.utils.logger import setup_logger
+
+log = setup_logger()
+
+# Number of PMIDs requested per efetch call
+EFETCH_CHUNK_SIZE = 50
+
+# Month abbreviations used in PubMed PubDate elements
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
 
 class PubMedScraper(BaseScraper):
     """
@@ -24,19 +41,30 @@ class PubMedScraper(BaseScraper):
     including search and parsing of PubMed XML responses.
     """
     
-    def __init__(self):
-        """Initialize the PubMed scraper."""
-        super().__init__('pubmed')
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the PubMed scraper.
+        
+        Args:
+            session (Optional[aiohttp.ClientSession]): Shared HTTP session
+        """
+        super().__init__('pubmed', session)
+        # Space E-utilities request starts to stay under NCBI's per-second
+        # rate limit (10/s with an API key, 3/s without)
+        self._min_interval = 1 / (10 if NCBI_API_KEY else 3)
+        self._throttle_lock = asyncio.Lock()
+        self._next_request_at = 0.0
         # Setup NLTK resources
         setup_nltk()
     
-    async def search(self, query: str, max_results: int = 10) -> List[Paper]:
+    async def search(self, query: str, max_results: int = 10, force_refresh: bool = False) -> List[Paper]:
         """
         Search for papers on PubMed.
         
         Args:
             query (str): Search query
             max_results (int): Maximum number of results to return
+            force_refresh (bool): Bypass the response cache and fetch from the network
             
         Returns:
             List[Paper]: List of matching papers
@@ -45,18 +73,22 @@ class PubMedScraper(BaseScraper):
         search_params = {
             'db': 'pubmed',
             'term': f'({query}[Title/Abstract]) AND (hasabstract[text])',  # Search in title/abstract and require abstract
-            'retmax': min(max_results * 2, self.config['max_results']),  # Get more results for better filtering
+            'retmax': min(max_results * 2, self.config.max_results),  # Get more results for better filtering
             'retmode': 'json',
             'sort': 'relevance'  # Sort by relevance instead of date
         }
         
-        search_response_text = await self._make_request(
-            f"{self.config['base_url']}/esearch.fcgi",
-            search_params
+        if NCBI_API_KEY:
+            search_params['api_key'] = NCBI_API_KEY
+        
+        search_response_body = await self._make_request(
+            f"{self.config.base_url}/esearch.fcgi",
+            search_params,
+            force_refresh
         )
         
         # Parse JSON response
-        search_response = json.loads(search_response_text)
+        search_response = orjson.loads(search_response_body)
         
         # Extract paper IDs
         paper_ids = search_response['esearchresult']['idlist']
@@ -64,27 +96,79 @@ class PubMedScraper(BaseScraper):
         if not paper_ids:
             return []
         
-        # Then, fetch details for each paper
+        # Then, fetch details in chunks of ids, concurrently
+        chunks = [
+            paper_ids[i:i + EFETCH_CHUNK_SIZE]
+            for i in range(0, len(paper_ids), EFETCH_CHUNK_SIZE)
+        ]
+        fetch_response_bodies = await asyncio.gather(
+            *(self._fetch_details(chunk, force_refresh) for chunk in chunks)
+        )
+        
+        papers = []
+        for fetch_response_body in fetch_response_bodies:
+            papers.extend(self._parse_articles(fetch_response_body))
+        
+        # Sort papers by relevance (title match first, then abstract match)
+        query_lower = query.lower()
+        papers.sort(key=lambda p: (
+            query_lower not in p.title.lower(),  # True comes after False
+            query_lower not in p.abstract.lower()
+        ))
+            
+        return papers[:max_results]
+    
+    async def _fetch_details(self, paper_ids: List[str], force_refresh: bool = False) -> bytes:
+        """
+        Fetch the efetch XML for a chunk of PubMed ids.
+        
+        Args:
+            paper_ids (List[str]): PubMed ids to fetch
+            force_refresh (bool): Bypass the response cache and fetch from the network
+            
+        Returns:
+            bytes: Raw efetch XML response
+        """
         fetch_params = {
             'db': 'pubmed',
             'id': ','.join(paper_ids),
             'retmode': 'xml'
         }
+        if NCBI_API_KEY:
+            fetch_params['api_key'] = NCBI_API_KEY
         
-        fetch_response_text = await self._make_request(
-            f"{self.config['base_url']}/efetch.fcgi",
-            fetch_params
+        return await self._make_request(
+            f"{self.config.base_url}/efetch.fcgi",
+            fetch_params,
+            force_refresh
         )
+    
+    async def _throttle(self):
+        """Wait until at least _min_interval has passed since the last request started."""
+        async with self._throttle_lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_request_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = loop.time() + self._min_interval
+    
+    def _parse_articles(self, fetch_response_body: bytes) -> List[Paper]:
+        """
+        Parse an efetch XML response into papers.
         
-        # Parse XML response
-        root = ET.fromstring(fetch_response_text)
-        namespace = {'pubmed': 'http://www.ncbi.nlm.nih.gov/pubmed'}
-        
-        # Extract papers
+        Args:
+            fetch_response_body (bytes): Raw efetch XML response
+            
+        Returns:
+            List[Paper]: Papers with a usable abstract
+        """
+        # Stream-parse the XML response one article at a time.
+        # PubMed efetch XML is not namespaced, so tags are matched unqualified.
         papers = []
-        for article in root.findall('.//pubmed:PubmedArticle', namespace):
+        context = etree.iterparse(io.BytesIO(fetch_response_body), tag='PubmedArticle')
+        for _, article in context:
             try:
-                paper_data = self._extract_paper_data(article, namespace)
+                paper_data = self._extract_paper_data(article)
                 
                 # Skip papers with very short abstracts
                 if not paper_data['abstract'] or len(paper_data['abstract'].split()) < 10:
@@ -92,49 +176,66 @@ class PubMedScraper(BaseScraper):
                     
                 papers.append(self._parse_paper(paper_data))
             except (AttributeError, ValueError) as e:
-                print(f"Error parsing paper: {e}")
+                log.warning(
+                    "Failed to parse %s entry: %s", self.source_name, e,
+                    exc_info=log.isEnabledFor(logging.DEBUG)
+                )
                 continue
+            finally:
+                # Release the processed article and its already-parsed siblings
+                article.clear()
+                while article.getprevious() is not None:
+                    del article.getparent()[0]
         
-        # Sort papers by relevance (title match first, then abstract match)
-        papers.sort(key=lambda p: (
-            query.lower() not in p.title.lower(),  # True comes after False
-            query.lower() not in p.abstract.lower()
-        ))
-            
-        return papers[:max_results]
+        return papers
     
-    def _extract_paper_data(self, article: ET.Element, namespace: dict) -> dict:
+    def _extract_paper_data(self, article: etree._Element) -> dict:
         """
         Extract paper data from PubMed XML element.
         
         Args:
-            article (ET.Element): XML element containing paper data
-            namespace (dict): XML namespace mapping
+            article (etree._Element): XML element containing paper data
             
         Returns:
             dict: Extracted paper data
         """
         # Extract basic information
-        title = article.find('.//pubmed:ArticleTitle', namespace).text
-        abstract = article.find('.//pubmed:AbstractText', namespace).text or ''
+        title = article.find('.//ArticleTitle').text
+        abstract = article.find('.//AbstractText').text or ''
         
         # Extract authors
         authors = []
-        for author in article.findall('.//pubmed:Author', namespace):
-            last_name = author.find('pubmed:LastName', namespace)
-            fore_name = author.find('pubmed:ForeName', namespace)
+        for author in article.iterfind('.//Author'):
+            last_name = fore_name = None
+            for child in author:
+                if child.tag == 'LastName':
+                    last_name = child.text
+                elif child.tag == 'ForeName':
+                    fore_name = child.text
             if last_name is not None and fore_name is not None:
-                authors.append(f"{last_name.text} {fore_name.text}")
+                authors.append(f"{last_name} {fore_name}")
         
-        # Extract publication date
-        pub_date = article.find('.//pubmed:PubDate', namespace)
-        year = pub_date.find('pubmed:Year', namespace).text
-        month = pub_date.find('pubmed:Month', namespace).text
-        day = pub_date.find('pubmed:Day', namespace).text or '01'
-        published = datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
+        # Extract publication date in a single pass over PubDate's children
+        pub_date = article.find('.//PubDate')
+        if pub_date is None:
+            raise ValueError("article has no PubDate")
+        year = month = None
+        day = '01'
+        for child in pub_date:
+            if child.tag == 'Year':
+                year = child.text
+            elif child.tag == 'Month':
+                month = child.text
+            elif child.tag == 'Day':
+                day = child.text or '01'
+        if not year:
+            raise ValueError("PubDate has no Year element")
+        # PubMed emits months either as numbers or as 3-letter abbreviations
+        month_num = MONTHS.get(month) or int(month or 1)
+        published = datetime(int(year), month_num, int(day))
         
         # Extract URL
-        pmid = article.find('.//pubmed:PMID', namespace).text
+        pmid = article.find('.//PMID').text
         url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
         
         return {
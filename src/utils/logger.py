@@ -6,8 +6,10 @@ import sys
 from pathlib import Path
 
 def setup_logger():
-    """Configura e retorna um logger para o projeto"""
+    """Configura e retorna um logger para o projeto (chamadas repetidas reutilizam os handlers)"""
     logger = logging.getLogger('paper_scraper')
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
     
     # Criar diretório de logs se não existir
@@ -0,0 +1,115 @@
+"""
+On-disk cache for HTTP responses.
+
+This module provides a small SQLite-backed cache used by the scrapers to store
+raw API responses, so repeated queries to read-only endpoints (arXiv, PubMed)
+can be served locally instead of paying a full network round trip.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+class ResponseCache:
+    """
+    SQLite-backed cache of response bodies with a time-to-live.
+
+    Expired rows are pruned on open and on every write, and the oldest rows
+    are evicted once the stored bodies exceed size_limit bytes.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+        ttl (int): Number of seconds a cached response stays valid
+        size_limit (int): Maximum total size of cached bodies, in bytes
+    """
+
+    def __init__(self, path: Path, ttl: int = 3600, size_limit: int = 512 * 1024 * 1024):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path (Path): Location of the SQLite database file
+            ttl (int): Number of seconds a cached response stays valid
+            size_limit (int): Maximum total size of cached bodies, in bytes
+        """
+        self.path = path
+        self.ttl = ttl
+        self.size_limit = size_limit
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)'
+        )
+        self._prune()
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: dict) -> str:
+        """
+        Build a stable cache key for a request.
+
+        Args:
+            url (str): Requested URL
+            params (dict): Query parameters
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        raw = f"{url}?{sorted((str(k), str(v)) for k, v in params.items())}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached body for a key if it has not expired.
+
+        Args:
+            key (str): Cache key from make_key()
+
+        Returns:
+            Optional[bytes]: Cached response body, or None on a miss
+        """
+        row = self._conn.execute(
+            'SELECT body FROM responses WHERE key = ? AND fetched_at >= ?',
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, body: bytes):
+        """
+        Store a response body under a key.
+
+        Args:
+            key (str): Cache key from make_key()
+            body (bytes): Raw response body
+        """
+        self._conn.execute(
+            'INSERT OR REPLACE INTO responses (key, body, fetched_at) VALUES (?, ?, ?)',
+            (key, body, time.time())
+        )
+        self._prune()
+        self._conn.commit()
+
+    def _prune(self):
+        """Delete expired rows, then the oldest rows beyond size_limit."""
+        self._conn.execute(
+            'DELETE FROM responses WHERE fetched_at < ?',
+            (time.time() - self.ttl,)
+        )
+        # Keep the newest rows whose cumulative body size fits in size_limit
+        self._conn.execute(
+            'DELETE FROM responses WHERE key IN ('
+            'SELECT key FROM (SELECT key, SUM(LENGTH(body)) OVER '
+            '(ORDER BY fetched_at DESC, key) AS total FROM responses) '
+            'WHERE total > ?)',
+            (self.size_limit,)
+        )
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -6,28 +6,50 @@ including text cleaning, keyword extraction, and summary generation using NLP te
 """
 
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
-from nltk.probability import FreqDist
 from nltk.tag import pos_tag
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterable, Optional, Tuple
 import re
 import os
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+
+from src.utils.logger import setup_logger
+
+log = setup_logger()
+
+# Tokenizadores pré-compilados (substituem word_tokenize/sent_tokenize do NLTK)
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
+# Padrões usados por clean_text()
+_CLEAN_RE = re.compile(r'[^a-zA-Z\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Estado do NLTK, preenchido uma única vez por setup_nltk()
+_NLTK_READY = False
+_STOPWORDS: frozenset = frozenset()
 
 def setup_nltk():
     """
-    Download required NLTK resources.
+    Download required NLTK resources and load the English stopword set.
+    
+    Only the first call does any work; later calls return immediately.
     
     Downloads:
-    - punkt: For sentence tokenization
     - stopwords: For common word filtering
     - averaged_perceptron_tagger: For part-of-speech tagging
     """
+    global _NLTK_READY, _STOPWORDS
+    if _NLTK_READY:
+        return
+    
     # Desabilita mensagens de download
     nltk.downloader._show_info = lambda *args, **kwargs: None
     
     # Lista de recursos necessários
-    resources = ['punkt', 'stopwords', 'averaged_perceptron_tagger']
+    resources = ['stopwords', 'averaged_perceptron_tagger']
     
     # Baixa cada recurso silenciosamente
     for resource in resources:
@@ -36,6 +58,14 @@ def setup_nltk():
         except Exception as e:
             print(f"Aviso: Erro ao baixar recurso {resource}: {e}")
             continue
+    
+    # Sem o corpus (offline), segue sem filtrar stopwords em vez de falhar
+    try:
+        _STOPWORDS = frozenset(stopwords.words('english'))
+    except LookupError:
+        log.warning("NLTK stopwords unavailable; keywords will include stopwords")
+        _STOPWORDS = frozenset()
+    _NLTK_READY = True
 
 def clean_text(text: str) -> str:
     """
@@ -50,16 +80,8 @@ def clean_text(text: str) -> str:
             - Removed special characters
             - Normalized whitespace
     """
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove special characters and digits
-    text = re.sub(r'[^a-zA-Z\s]', '', text)
-    
-    # Normalize whitespace
-    text = ' '.join(text.split())
-    
-    return text
+    # Lowercase, remove special characters and digits, normalize whitespace
+    return _WS_RE.sub(' ', _CLEAN_RE.sub('', text.lower())).strip()
 
 def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
     """
@@ -73,39 +95,44 @@ def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
         List[str]: List of extracted keywords
     """
     # Tokenize and clean
-    words = word_tokenize(clean_text(text))
+    words = _WORD_RE.findall(clean_text(text))
     
-    # Remove stopwords
-    stop_words = set(stopwords.words('english'))
-    words = [w for w in words if w not in stop_words]
-    
-    # Calculate word frequencies
-    fdist = FreqDist(words)
+    return _top_keywords(words, num_keywords)
+
+def _top_keywords(words: Iterable[str], num_keywords: int = 10) -> List[str]:
+    """Return the most frequent non-stopwords longer than two letters."""
+    if not _NLTK_READY:
+        setup_nltk()
+    counts = Counter(w for w in words if w not in _STOPWORDS and len(w) > 2)
     
     # Return most common words
-    return [word for word, _ in fdist.most_common(num_keywords)]
+    return [word for word, _ in counts.most_common(num_keywords)]
 
-def calculate_sentence_scores(sentences: List[str], keywords: List[str]) -> Dict[str, float]:
+def calculate_sentence_scores(
+    sentences: List[str],
+    keywords: List[str],
+    sentence_tokens: Optional[List[List[str]]] = None
+) -> Dict[str, float]:
     """
     Calculate relevance scores for sentences based on keyword presence and position.
     
     Args:
         sentences (List[str]): List of sentences to score
         keywords (List[str]): List of keywords to look for
+        sentence_tokens (Optional[List[List[str]]]): Pre-tokenized words of each
+            sentence. Tokenized here when omitted.
         
     Returns:
         Dict[str, float]: Dictionary mapping sentences to their scores
     """
     scores = {}
+    keyword_set = frozenset(keywords)
+    if sentence_tokens is None:
+        sentence_tokens = [_WORD_RE.findall(clean_text(s)) for s in sentences]
     
-    for i, sentence in enumerate(sentences):
-        score = 0
-        words = word_tokenize(clean_text(sentence))
-        
+    for i, (sentence, words) in enumerate(zip(sentences, sentence_tokens)):
         # Calculate score based on keyword presence
-        for word in words:
-            if word in keywords:
-                score += 1
+        score = sum(1 for word in words if word in keyword_set)
         
         # Bônus para frases no início do texto
         position_bonus = 1.0 - (i / len(sentences))
@@ -126,6 +153,8 @@ def generate_summary(text: str, num_sentences: int = 3) -> str:
     """
     Generate a summary of the input text using extractive summarization.
     
+    Results are memoized, so repeated abstracts are summarized only once.
+    
     Args:
         text (str): Input text to summarize
         num_sentences (int): Number of sentences in the summary
@@ -133,19 +162,35 @@ def generate_summary(text: str, num_sentences: int = 3) -> str:
     Returns:
         str: Generated summary
     """
+    return _cached_summary(text, num_sentences)
+
+def _summary_impl(text: str, num_sentences: int) -> str:
+    """Uncached implementation of generate_summary()."""
     # Tokenize into sentences
-    sentences = sent_tokenize(text)
+    sentences = _SENT_RE.split(text.strip())
+    
+    # Nothing to select when the text is already short enough
+    if len(sentences) <= num_sentences:
+        return text
+    
+    # Tokenize every sentence once; keywords and scores share these tokens
+    sentence_tokens = [_WORD_RE.findall(clean_text(s)) for s in sentences]
     
     # Extract keywords
-    keywords = extract_keywords(text)
+    keywords = _top_keywords(chain.from_iterable(sentence_tokens))
     
     # Calculate sentence scores
-    scores = calculate_sentence_scores(sentences, keywords)
+    scores = calculate_sentence_scores(sentences, keywords, sentence_tokens)
     
     # Select top sentences
     top_sentences = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
     
-    # Reconstruct summary maintaining original order
-    summary_sentences = [s for s, _ in sorted(top_sentences, key=lambda x: sentences.index(x[0]))]
+    # Reconstruct summary maintaining original order (first occurrence wins)
+    pos = {}
+    for i, sentence in enumerate(sentences):
+        pos.setdefault(sentence, i)
+    summary_sentences = [s for s, _ in sorted(top_sentences, key=lambda x: pos[x[0]])]
     
-    return ' '.join(summary_sentences) 
\ No newline at end of file
+    return ' '.join(summary_sentences) 
+
+_cached_summary = lru_cache(maxsize=4096)(_summary_impl)